@@ -0,0 +1,78 @@
+import random
+import unittest
+from unittest import mock
+from hearts.models.Agent import MCTSAgent
+from hearts.models.AgentComparison import AgentComparison, SequentialTest, BASELINE, CANDIDATE
+from hearts.models.RandomAgent import RandomPlayer
+
+class TestSequentialTest(unittest.TestCase):
+    def test_decides_for_candidate(self):
+        """Test that repeated evidence for the candidate accepts H1."""
+        test = SequentialTest(0.05, 0.05)
+        while test.decision() is None:
+            test.update(0.5)
+        self.assertEqual(test.decision(), CANDIDATE)
+
+    def test_decides_for_baseline(self):
+        """Test that repeated evidence for the baseline accepts H0."""
+        test = SequentialTest(0.05, 0.05)
+        while test.decision() is None:
+            test.update(-0.5)
+        self.assertEqual(test.decision(), BASELINE)
+
+class TestAgentComparison(unittest.TestCase):
+    def setUp(self):
+        """Set up a comparison between two identical configurations."""
+        self.comparison = AgentComparison(RandomPlayer, RandomPlayer, min_deals=2, max_deals=4, seed=0)
+
+    def test_duplicate_deals_are_replayed(self):
+        """Test that the same deal seed produces the same result for the same configuration."""
+        self.assertEqual(self.comparison.play_deal(RandomPlayer, 7), self.comparison.play_deal(RandomPlayer, 7))
+
+    def test_play_deal_restores_random_state(self):
+        """Test that playing a deal leaves the global random state untouched."""
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        self.comparison.play_deal(RandomPlayer, 7)
+        self.assertEqual(random.random(), expected)
+
+    def test_opponents_replay_across_configurations(self):
+        """Test that opponents play the same cards whatever randomness the agent uses."""
+        play_card = RandomPlayer.play_card
+
+        def record_plays(iterations):
+            agents, plays = [], []
+            def make_agent(name):
+                agents.append(MCTSAgent(name, iterations))
+                return agents[-1]
+            def recording_play_card(player, lead_suit, hearts_broken):
+                card = play_card(player, lead_suit, hearts_broken)
+                plays.append((player.rng, player.name, str(card)))
+                return card
+            with mock.patch.object(RandomPlayer, "play_card", autospec=True, side_effect=recording_play_card):
+                self.comparison.play_deal(make_agent, 7)
+            # Rollout players share the agent's stream; keep only the real opponents
+            return [(name, card) for rng, name, card in plays if rng is not agents[0].rng]
+
+        # Both play the first valid card, but their rollouts draw different amounts of randomness
+        few_rollouts = record_plays(2)
+        many_rollouts = record_plays(30)
+        self.assertEqual(len(few_rollouts), 39, "Three opponents should play 13 cards each.")
+        self.assertEqual(few_rollouts, many_rollouts)
+
+    def test_identical_configurations_run_to_cap(self):
+        """Test that identical play gives no evidence and stops at max_deals."""
+        result = self.comparison.run()
+        self.assertEqual(result.deals, 4)
+        self.assertFalse(result.is_decided())
+        self.assertEqual(result.baseline_avg_score, result.candidate_avg_score)
+
+    def test_score_llr_sign(self):
+        """Test that score differences favouring the candidate give a positive ratio."""
+        self.assertGreater(self.comparison.score_llr([3, 1, 4, 2]), 0)
+        self.assertLess(self.comparison.score_llr([-3, -1, -4, -2]), 0)
+        self.assertEqual(self.comparison.score_llr([0, 0, 0]), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,11 @@
 import unittest
+from unittest import mock
 from copy import deepcopy
-from models.Agent import MCTSAgent
-from models.Game import HeartsGame
-from models.Card import Card
-from models.RandomAgent import RandomPlayer
-from models.Player import Player
+from hearts.models.Agent import MCTSAgent
+from hearts.models.Game import HeartsGame
+from hearts.models.Card import Card
+from hearts.models.RandomAgent import RandomPlayer
+from hearts.models.Player import Player
 
 class TestMCTSAgent(unittest.TestCase):
     def setUp(self):
@@ -36,6 +37,21 @@ class TestMCTSAgent(unittest.TestCase):
         mcts_player.run_simulation(self.game)
         self.assertGreater(len(mcts_player.tree), initial_tree_size, "The MCTS tree should be updated after a simulation.")
 
+    def test_simulation_uses_own_seat(self):
+        """Test that with several MCTS agents each one simulates from its own seat."""
+        game = HeartsGame(2, 2, 5)
+        game.deck.shuffle()
+        for player, hand in zip(game.players, game.deck.deal(num_hands=4, cards_per_hand=13)):
+            player.receive_hand(hand)
+        first_mcts, second_mcts = game.players[0], game.players[1]
+        first_mcts.hand = first_mcts.hand[:4]  # Simulating from the first agent's seat would only play 4 cards
+
+        simulated = []
+        with mock.patch.object(MCTSAgent, "update_tree", lambda agent, game_copy: simulated.append(game_copy)):
+            second_mcts.run_simulation(game)
+        played = sum(len(player.hand) for player in game.players) - sum(len(player.hand) for player in simulated[0].players)
+        self.assertEqual(played, len(second_mcts.hand), "The simulation should run for the second agent's hand.")
+
     def test_select_best_move(self):
         """Test that the agent selects the best move based on MCTS statistics."""
         mcts_player = next(player for player in self.game.players if isinstance(player, MCTSAgent))
@@ -49,6 +65,37 @@ class TestMCTSAgent(unittest.TestCase):
         best_move = mcts_player.select_best_move()
         self.assertEqual(best_move, Card(1, 5), "The agent should select the move with the highest win rate.")
 
+    def test_get_move_classes(self):
+        """Test that equivalent cards collapse into one representative move."""
+        mcts_player = next(player for player in self.game.players if isinstance(player, MCTSAgent))
+
+        # 7 and 8 of Clubs are adjacent, the 10 is separated by the outstanding 9
+        mcts_player.hand = [Card(0, 5), Card(0, 6), Card(0, 8), Card(1, 3)]
+        moves = mcts_player.get_move_classes(mcts_player.hand, [])
+        self.assertEqual(moves, [Card(0, 5), Card(0, 8), Card(1, 3)])
+
+        # Once the 9 of Clubs is played, the whole Clubs run is one move
+        moves = mcts_player.get_move_classes(mcts_player.hand, [Card(0, 7)])
+        self.assertEqual(moves, [Card(0, 5), Card(1, 3)])
+
+        # A card still on the table separates the run: ducking with the 7 and winning
+        # with the 9 under a led 8 of Clubs are different moves
+        mcts_player.hand = [Card(0, 5), Card(0, 7)]
+        moves = mcts_player.get_move_classes(mcts_player.hand, [], [Card(0, 6)])
+        self.assertEqual(moves, [Card(0, 5), Card(0, 7)])
+        moves = mcts_player.get_move_classes(mcts_player.hand, [Card(0, 6)])
+        self.assertEqual(moves, [Card(0, 5)], "Once the trick is complete the 8 no longer separates them.")
+
+        # Representatives keep the order of the valid moves, not sorted order
+        mcts_player.hand = [Card(0, 6), Card(1, 3), Card(0, 5)]
+        moves = mcts_player.get_move_classes(mcts_player.hand, [])
+        self.assertEqual(moves, [Card(0, 6), Card(1, 3)])
+
+        # The Queen of Spades is never grouped with its neighbours
+        mcts_player.hand = [Card(3, 9), Card(3, 10), Card(3, 11)]
+        moves = mcts_player.get_move_classes(mcts_player.hand, [])
+        self.assertEqual(moves, [Card(3, 9), Card(3, 10), Card(3, 11)])
+
     def test_game_integration(self):
         """Test the integration of MCTSAgent within the game."""
         self.game.start_round()  # Run a full round
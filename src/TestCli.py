@@ -0,0 +1,34 @@
+import unittest
+from hearts.cli import build_parser, main, run_simulations
+
+class TestCli(unittest.TestCase):
+    def test_parse_simulate(self):
+        """Test that simulate accepts four seat specs."""
+        args = build_parser().parse_args(["simulate", "--rounds", "3", "--seats", "mcts:50", "random", "random", "random"])
+        self.assertEqual(args.rounds, 3)
+        self.assertEqual(args.seats, ["mcts:50", "random", "random", "random"])
+
+    def test_invalid_seat_rejected(self):
+        """Test that unknown seat types are rejected."""
+        with self.assertRaises(SystemExit):
+            build_parser().parse_args(["simulate", "--seats", "human", "random", "random", "random"])
+
+    def test_invalid_counts_rejected(self):
+        """Test that negative counts, zero rounds and more than 4 agents are rejected."""
+        for argv in (["play", "--mcts", "-1"], ["play", "--random", "x"], ["simulate", "--rounds", "0"], ["play", "--mcts", "3", "--random", "2"]):
+            with self.subTest(argv=argv), self.assertRaises(SystemExit):
+                main(argv)
+
+    def test_run_simulations_with_two_mcts_seats(self):
+        """Test that each MCTS seat simulates from its own hand."""
+        points, _ = run_simulations(1, ["mcts:5", "mcts:5", "random", "random"], 100, seed=0)
+        self.assertEqual(sum(points), 26)
+
+    def test_run_simulations(self):
+        """Test that headless rounds award all 26 points each round."""
+        points, wins = run_simulations(2, ["mcts:10", "random", "random", "random"], 100, seed=0)
+        self.assertEqual(sum(points), 52, "Each round should award 26 points in total.")
+        self.assertGreaterEqual(sum(wins), 2, "Every round should have at least one winner.")
+
+if __name__ == "__main__":
+    unittest.main()
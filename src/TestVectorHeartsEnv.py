@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+from hearts.models.VectorHeartsEnv import VectorHeartsEnv, STARTING_CARD, CARD_SUITS
+
+class TestVectorHeartsEnv(unittest.TestCase):
+    def setUp(self):
+        """Set up a small batch of games for testing."""
+        self.num_envs = 8
+        self.env = VectorHeartsEnv(self.num_envs, seed=0)
+        self.rng = np.random.default_rng(0)
+
+    def random_actions(self, legal):
+        """Pick a random legal card in every environment."""
+        noise = self.rng.random(legal.shape)
+        return np.where(legal, noise, -1).argmax(axis=1)
+
+    def test_reset_deals_full_hands(self):
+        """Test that every seat is dealt 13 cards and the 2 of Clubs must lead."""
+        obs, legal = self.env.reset()
+        self.assertTrue((self.env.hands.sum(axis=2) == 13).all(), "Every seat should hold 13 cards.")
+        self.assertTrue((self.env.hands.sum(axis=1) == 1).all(), "Every card should be held by exactly one seat.")
+        self.assertTrue((legal.sum(axis=1) == 1).all())
+        self.assertTrue(legal[:, STARTING_CARD].all(), "The first trick must be led with the 2 of Clubs.")
+        self.assertTrue(obs["hand"][:, STARTING_CARD].all())
+
+    def test_legal_actions_follow_suit(self):
+        """Test that seats holding the lead suit must follow it."""
+        obs, legal = self.env.reset()
+        obs, legal, _, _ = self.env.step(self.random_actions(legal))
+        for i in range(self.num_envs):
+            hand = np.flatnonzero(obs["hand"][i])
+            if (CARD_SUITS[hand] == 0).any():
+                self.assertTrue((CARD_SUITS[np.flatnonzero(legal[i])] == 0).all())
+            else:
+                self.assertTrue((legal[i] == obs["hand"][i]).all())
+
+    def test_illegal_action_raises(self):
+        """Test that playing a card outside the legal mask is rejected."""
+        self.env.reset()
+        actions = np.full(self.num_envs, STARTING_CARD + 1)
+        with self.assertRaises(ValueError):
+            self.env.step(actions)
+
+    def test_invalid_action_raises(self):
+        """Test that out-of-range and non-integer card ids are rejected."""
+        self.env.reset()
+        for actions in (np.full(self.num_envs, 52), np.full(self.num_envs, -1), np.full(self.num_envs, 0.0)):
+            with self.assertRaises(ValueError):
+                self.env.step(actions)
+
+    def test_round_awards_all_points(self):
+        """Test that a full round hands out all 26 points and deals a new round."""
+        _, legal = self.env.reset()
+        total_rewards = np.zeros((self.num_envs, 4))
+        for _ in range(52):
+            _, legal, rewards, _ = self.env.step(self.random_actions(legal))
+            total_rewards += rewards
+        self.assertTrue((total_rewards.sum(axis=1) == -26).all(), "A round should award 26 points in total.")
+        self.assertTrue((self.env.scores.sum(axis=1) == 26).all())
+        self.assertTrue((self.env.hands.sum(axis=2) == 13).all(), "A new round should be dealt.")
+
+    def test_games_auto_reset(self):
+        """Test that finished games are flagged done and restarted."""
+        _, legal = self.env.reset()
+        finished = np.zeros(self.num_envs, dtype=bool)
+        for _ in range(52 * 40):
+            _, legal, _, dones = self.env.step(self.random_actions(legal))
+            finished |= dones
+            if dones.any():
+                self.assertTrue((self.env.scores[dones] == 0).all(), "Finished games should start from zero.")
+                self.assertTrue((self.env.final_scores[dones].max(axis=1) >= 100).all(), "Final scores should reach the target.")
+            if finished.all():
+                break
+        self.assertTrue(finished.all(), "Every game should eventually finish.")
+
+if __name__ == "__main__":
+    unittest.main()
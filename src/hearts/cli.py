@@ -0,0 +1,144 @@
+import argparse
+from typing import List, Optional
+
+# Game modules are imported inside each command so `hearts --help` and argument
+# errors return without loading them
+
+SEAT_TYPES = ["mcts", "random"]
+
+
+def non_negative_int(value: str) -> int:
+    """Parse an integer argument that must be zero or more."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer '{value}'.")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"Value must be zero or more, got {number}.")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """Parse an integer argument that must be at least 1."""
+    number = non_negative_int(value)
+    if number == 0:
+        raise argparse.ArgumentTypeError("Value must be at least 1.")
+    return number
+
+
+def parse_seat(value: str) -> str:
+    """Validate a seat spec: 'random', 'mcts' or 'mcts:<iterations>'."""
+    kind, _, iterations = value.partition(":")
+    if kind not in SEAT_TYPES or (iterations and (kind != "mcts" or not iterations.isdigit())):
+        raise argparse.ArgumentTypeError(f"Invalid seat '{value}'. Use 'random', 'mcts' or 'mcts:<iterations>'.")
+    return value
+
+
+def make_players(seats: List[str], simulations: int):
+    """Create one agent per seat spec."""
+    from hearts.models.Agent import MCTSAgent
+    from hearts.models.RandomAgent import RandomPlayer
+
+    players = []
+    for i, seat in enumerate(seats):
+        kind, _, iterations = seat.partition(":")
+        if kind == "mcts":
+            players.append(MCTSAgent(f"MCTS Player {i+1}", int(iterations) if iterations else simulations))
+        else:
+            players.append(RandomPlayer(f"Random Player {i+1}"))
+    return players
+
+
+def run_simulations(rounds: int, seats: List[str], simulations: int, seed: Optional[int] = None):
+    """Play headless rounds and return the total points and wins for each seat."""
+    import contextlib
+    import os
+    import random
+    from hearts.models.Game import HeartsGame
+
+    if seed is not None:
+        random.seed(seed)
+
+    points = [0] * len(seats)
+    wins = [0] * len(seats)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(rounds):
+            game = HeartsGame(0, 0)
+            seat_players = make_players(seats, simulations)
+            game.players = list(seat_players)
+            game.start_round()
+
+            round_scores = [player.calculate_score() for player in seat_players]
+            for i, score in enumerate(round_scores):
+                points[i] += score
+                if score == min(round_scores):
+                    wins[i] += 1
+    return points, wins
+
+
+def play(args):
+    """Play an interactive game against MCTS and Random agents."""
+    from hearts.models.Game import HeartsGame
+
+    print("Welcome to the Hearts Card Game!")
+    game = HeartsGame(args.mcts, args.random, args.simulations)
+    game.start_game()
+
+
+def simulate(args):
+    """Play rounds between agents without printing game progress, then report results."""
+    points, wins = run_simulations(args.rounds, args.seats, args.simulations, args.seed)
+    for i, seat in enumerate(args.seats):
+        print(f"Seat {i+1} ({seat}): Avg Score: {points[i] / args.rounds:.2f} | Round Win Rate: {wins[i] / args.rounds:.2f}")
+    print("A round is won by the lowest score; tied seats each count the win, so win rates can sum to more than 1.")
+
+
+def profile(args):
+    """Run simulate under cProfile and print the most expensive functions."""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.runcall(simulate, args)
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(args.sort).print_stats(args.limit)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the hearts command."""
+    parser = argparse.ArgumentParser(prog="hearts", description="Play and simulate the Hearts card game.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    play_parser = subparsers.add_parser("play", help="Play an interactive game.")
+    play_parser.add_argument("--mcts", type=non_negative_int, default=1, help="Number of MCTS agents (default: 1).")
+    play_parser.add_argument("--random", type=non_negative_int, default=2, help="Number of Random agents (default: 2).")
+    play_parser.add_argument("--simulations", type=non_negative_int, default=100, help="MCTS iterations per move (default: 100).")
+    play_parser.set_defaults(func=play)
+
+    simulate_parser = subparsers.add_parser("simulate", help="Play headless rounds between agents.")
+    profile_parser = subparsers.add_parser("profile", help="Profile headless rounds between agents.")
+    for sub in (simulate_parser, profile_parser):
+        sub.add_argument("--rounds", type=positive_int, default=10, help="Number of single rounds to play (default: 10).")
+        sub.add_argument(
+            "--seats", type=parse_seat, nargs=4, default=["mcts", "random", "random", "random"],
+            metavar="SEAT", help="Four seats, each 'random', 'mcts' or 'mcts:<iterations>'.",
+        )
+        sub.add_argument("--simulations", type=non_negative_int, default=100, help="Default MCTS iterations per move (default: 100).")
+        sub.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs.")
+    simulate_parser.set_defaults(func=simulate)
+
+    profile_parser.add_argument("--sort", default="cumulative", help="pstats sort key (default: cumulative).")
+    profile_parser.add_argument("--limit", type=int, default=25, help="Number of functions to show (default: 25).")
+    profile_parser.set_defaults(func=profile)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "play" and args.mcts + args.random > 4:
+        parser.error("The total number of MCTS and Random agents cannot exceed 4.")
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
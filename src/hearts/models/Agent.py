@@ -1,29 +1,34 @@
 from copy import deepcopy
 import math
 import random
-from typing import Optional
-from models.Game import HeartsGame
-from models.Card import Card
-from models.Player import Player
-from models.RandomAgent import RandomPlayer
+from typing import TYPE_CHECKING, List, Optional
+from hearts.models.Card import Card
+from hearts.models.Player import Player
+from hearts.models.RandomAgent import RandomPlayer
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing at runtime would cycle with hearts.models.Game
+    from hearts.models.Game import HeartsGame
 
 class MCTSAgent(Player):
     """MCTS implementation of Player"""
-    def __init__(self, name: str, iterations: int = 1000):
+    def __init__(self, name: str, iterations: int = 1000, rng: Optional[random.Random] = None):
         super().__init__(name)
         self.iterations = iterations
+        self.rng = rng if rng is not None else random  # Random stream used by rollouts
         self.tree = {} 
         self.exploration_constant = 1.5
 
-    def play_card(self, current_state: HeartsGame) -> Card:
+    def play_card(self, current_state: "HeartsGame") -> Card:
         """Interpretation of the play_card method for MCTS agents to choose the best move"""
 
         # Run simulations
         for _ in range(self.iterations):
             self.run_simulation(current_state)
 
-        # Select best move
-        best_card = self.select_best_move()
+        # Select best move, considering one card per class of equivalent cards
+        valid_moves = self.get_valid_moves(current_state.lead_suit, current_state.hearts_broken)
+        best_card = self.select_best_move(self.get_move_classes(valid_moves, current_state.get_played_cards(), current_state.current_trick))
         return best_card
 
     def run_simulation(self, current_state):
@@ -31,9 +36,10 @@ class MCTSAgent(Player):
         
         game_copy = current_state.copy()
 
-        # Identify MCTS agent and make it their turn since run_simulation is only utilized when MCTS agent needs to play_card
+        # Identify this MCTS agent by name and make it their turn since run_simulation is only utilized when it needs to play_card.
+        # Matching by name keeps games with several MCTS agents simulating from the right seat
         current_player_index = next(
-            (i for i, player in enumerate(game_copy.players) if isinstance(player, MCTSAgent)),
+            (i for i, player in enumerate(game_copy.players) if player.name == self.name),
             None
         )
         current_player = game_copy.players[current_player_index]
@@ -43,7 +49,7 @@ class MCTSAgent(Player):
             if isinstance(current_player, MCTSAgent):
                 # Handles MCTS agent play
                 valid_moves = current_player.get_valid_moves(game_copy.lead_suit, game_copy.hearts_broken)
-                chosen_card = random.choice(valid_moves)
+                chosen_card = self.rng.choice(current_player.get_move_classes(valid_moves, game_copy.get_played_cards(), game_copy.current_trick))
 
                 # Simulate the card being played without removing it from the hand directly
                 game_copy.play_card(current_player.name, chosen_card, game_copy.lead_suit, game_copy.hearts_broken)
@@ -78,7 +84,43 @@ class MCTSAgent(Player):
         # Otherwise, follow the lead suit if possible, or play any card
         return [card for card in self.hand if card.suit == lead_suit] or self.hand
 
-    def update_tree(self, game_copy: HeartsGame):
+    def get_move_classes(self, valid_moves: List[Card], played_cards: List[Card], current_trick: Optional[List[Card]] = None) -> List[Card]:
+        """Collapse strategically equivalent moves into one representative card each.
+
+        Cards of the same suit are equivalent when every rank between them was played in
+        a completed trick or is in this player's hand. Cards in the current trick are
+        still in play, so they separate runs. The Queen of Spades is never grouped since
+        it scores differently from its neighbours.
+        """
+        accounted_for = {(card.suit, card.rank) for card in played_cards}
+        accounted_for.update((card.suit, card.rank) for card in self.hand)
+        accounted_for.difference_update((card.suit, card.rank) for card in current_trick or [])
+
+        # Sort only to find the runs, labelling each card with the run it belongs to
+        move_class = {}
+        previous = None
+        for card in sorted(valid_moves, key=lambda c: (c.suit, c.rank)):
+            equivalent = (
+                previous is not None
+                and previous.suit == card.suit
+                and not previous.is_queen_of_spades()
+                and not card.is_queen_of_spades()
+                and all((card.suit, rank) in accounted_for for rank in range(previous.rank + 1, card.rank))
+            )
+            move_class[(card.suit, card.rank)] = move_class[(previous.suit, previous.rank)] if equivalent else len(move_class)
+            previous = card
+
+        # Keep the first card of each run in valid_moves order as its representative
+        representatives = []
+        seen_classes = set()
+        for card in valid_moves:
+            card_class = move_class[(card.suit, card.rank)]
+            if card_class not in seen_classes:
+                seen_classes.add(card_class)
+                representatives.append(card)
+        return representatives
+
+    def update_tree(self, game_copy: "HeartsGame"):
         """Update the tree based on the simulation results."""
         # Use the scores to determine the success of this simulation
         my_final_score = next(player.calculate_score() for player in game_copy.players if player.name == self.name)
@@ -93,13 +135,15 @@ class MCTSAgent(Player):
         if my_final_score < 5:  # Success threshhold
             self.tree[serialized_state]["wins"] += 1
 
-    def select_best_move(self):
+    def select_best_move(self, moves: Optional[List[Card]] = None):
         """Select the best move based on the tree's statistics, without copying the game state."""
+        if moves is None:
+            moves = self.hand
         best_move = None
         best_value = -float("inf")
 
-        # Loop through each card in hand
-        for card in self.hand:
+        # Loop through each candidate move
+        for card in moves:
             # Serialize the hypothetical game state for this card
             # Using the current agent's name and the card as part of the state key
             serialized_state = f"{self.name}-{str(card)}"
@@ -127,7 +171,7 @@ class MCTSAgent(Player):
 
     def copy(self):
         """Creates a deep copy of the MCTSAgent."""
-        new_agent = MCTSAgent(self.name, self.iterations)
+        new_agent = MCTSAgent(self.name, self.iterations, self.rng)
         new_agent.hand = deepcopy(self.hand)
         new_agent.takenCards = deepcopy(self.takenCards)
         new_agent.score = self.score
@@ -135,7 +179,7 @@ class MCTSAgent(Player):
 
     def make_random_player(self, player) -> RandomPlayer:
         """Convert this Player to a RandomPlayer with the same attributes."""
-        random_player = RandomPlayer(player.name)
+        random_player = RandomPlayer(player.name, self.rng)
         random_player.hand = deepcopy(player.hand)
         random_player.takenCards = deepcopy(player.takenCards)
         random_player.score = player.score
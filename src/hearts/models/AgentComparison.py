@@ -0,0 +1,190 @@
+import contextlib
+import math
+import os
+import random
+from typing import Callable, List, Optional, Tuple
+from hearts.models.Game import HeartsGame
+from hearts.models.Player import Player
+from hearts.models.RandomAgent import RandomPlayer
+
+# Outcomes of a sequential test
+BASELINE = "baseline"
+CANDIDATE = "candidate"
+
+
+class SequentialTest:
+    """Wald's sequential probability ratio test between two simple hypotheses.
+
+    H0 says the baseline is stronger, H1 says the candidate is stronger. Each
+    observation adds its log-likelihood ratio until one of the bounds is crossed.
+    """
+    def __init__(self, alpha: float = 0.05, beta: float = 0.05):
+        if not (0 < alpha < 1 and 0 < beta < 1):
+            raise ValueError("alpha and beta must be between 0 and 1.")
+        self.llr = 0.0
+        self.lower_bound = math.log(beta / (1 - alpha))
+        self.upper_bound = math.log((1 - beta) / alpha)
+
+    def update(self, llr_increment: float):
+        """Add one observation's log-likelihood ratio."""
+        self.llr += llr_increment
+
+    def set_llr(self, llr: float):
+        """Replace the statistic with a log-likelihood ratio recomputed from all observations."""
+        self.llr = llr
+
+    def decision(self) -> Optional[str]:
+        """Return the accepted hypothesis, or None if more data is needed."""
+        if self.llr >= self.upper_bound:
+            return CANDIDATE
+        if self.llr <= self.lower_bound:
+            return BASELINE
+        return None
+
+
+class ComparisonResult:
+    """Outcome of an AgentComparison run"""
+    def __init__(self, deals: int, win_rate_decision: Optional[str], score_decision: Optional[str],
+                 baseline_win_rate: float, candidate_win_rate: float,
+                 baseline_avg_score: float, candidate_avg_score: float):
+        self.deals = deals
+        self.win_rate_decision = win_rate_decision
+        self.score_decision = score_decision
+        self.baseline_win_rate = baseline_win_rate
+        self.candidate_win_rate = candidate_win_rate
+        self.baseline_avg_score = baseline_avg_score
+        self.candidate_avg_score = candidate_avg_score
+
+    def is_decided(self) -> bool:
+        """Check if both the win rate and the score tests reached a decision."""
+        return self.win_rate_decision is not None and self.score_decision is not None
+
+    def __str__(self):
+        return (
+            f"Deals: {self.deals} | "
+            f"Win Rate: {self.baseline_win_rate:.2f} vs {self.candidate_win_rate:.2f} ({self.win_rate_decision or 'undecided'}) | "
+            f"Avg Score: {self.baseline_avg_score:.2f} vs {self.candidate_avg_score:.2f} ({self.score_decision or 'undecided'})"
+        )
+
+
+class AgentComparison:
+    """Compares two agent configurations on duplicate deals with sequential tests.
+
+    Every deal is played twice from the same shuffle, once with each configuration
+    holding the same hand against the same RandomPlayer opponents. Win rate is tested
+    on the deals where exactly one configuration won, and mean score on the paired
+    score differences. Play stops once both tests are decided or max_deals is reached.
+    """
+    def __init__(self, baseline: Callable[[str], Player], candidate: Callable[[str], Player],
+                 alpha: float = 0.05, beta: float = 0.05,
+                 win_rate_margin: float = 0.1, score_margin: float = 1.0,
+                 min_deals: int = 10, max_deals: int = 200, seed: Optional[int] = None):
+        if not (0 < win_rate_margin < 0.5):
+            raise ValueError("win_rate_margin must be between 0 and 0.5.")
+        if score_margin <= 0:
+            raise ValueError("score_margin must be positive.")
+        if min_deals < 2 or max_deals < min_deals:
+            raise ValueError("min_deals must be at least 2 and no greater than max_deals.")
+        self.baseline = baseline
+        self.candidate = candidate
+        self.alpha = alpha
+        self.beta = beta
+        # Probability the candidate wins a split deal under H0 and H1
+        self.p0 = 0.5 - win_rate_margin / 2
+        self.p1 = 0.5 + win_rate_margin / 2
+        # Mean paired score advantage (baseline - candidate) under H0 and H1
+        self.score_margin = score_margin
+        self.min_deals = min_deals
+        self.max_deals = max_deals
+        self.rng = random.Random(seed)
+
+    def play_deal(self, make_agent: Callable[[str], Player], deal_seed: int) -> Tuple[bool, int]:
+        """Play one round from a seeded shuffle and return (won, score) for the agent."""
+        # Opponents, and the agent's rollouts if it has an rng, draw from their own streams
+        # seeded by the deal. Then both replays face the same opponent choices no matter
+        # how much randomness the agent uses.
+        agent = make_agent("Agent")
+        if hasattr(agent, "rng"):
+            agent.rng = random.Random(deal_seed * 4)
+        game = HeartsGame(0, 0)
+        game.players = [agent] + [
+            RandomPlayer(f"Random Player {i}", random.Random(deal_seed * 4 + i)) for i in range(1, 4)
+        ]
+
+        # Seeding the global stream before start_round makes the shuffle, and so every
+        # hand, repeatable. The caller's global random state is restored afterwards.
+        state = random.getstate()
+        random.seed(deal_seed)
+        try:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                game.start_round()
+        finally:
+            random.setstate(state)
+
+        score = agent.calculate_score()
+        won = score == min(player.calculate_score() for player in game.players)
+        return won, score
+
+    def run(self) -> ComparisonResult:
+        """Play duplicate deals until both sequential tests are decided or the cap is hit."""
+        win_test = SequentialTest(self.alpha, self.beta)
+        score_test = SequentialTest(self.alpha, self.beta)
+        win_decision = None
+        score_decision = None
+
+        candidate_win_llr = math.log(self.p1 / self.p0)
+        baseline_win_llr = math.log((1 - self.p1) / (1 - self.p0))
+
+        baseline_wins = candidate_wins = 0
+        baseline_scores: List[int] = []
+        candidate_scores: List[int] = []
+        differences: List[int] = []
+
+        deals = 0
+        while deals < self.max_deals:
+            deal_seed = self.rng.getrandbits(32)
+            baseline_won, baseline_score = self.play_deal(self.baseline, deal_seed)
+            candidate_won, candidate_score = self.play_deal(self.candidate, deal_seed)
+            deals += 1
+
+            baseline_wins += baseline_won
+            candidate_wins += candidate_won
+            baseline_scores.append(baseline_score)
+            candidate_scores.append(candidate_score)
+            differences.append(baseline_score - candidate_score)  # Positive favours the candidate
+
+            # Only split deals carry information about which configuration wins more
+            if win_decision is None and candidate_won != baseline_won:
+                win_test.update(candidate_win_llr if candidate_won else baseline_win_llr)
+
+            if deals >= self.min_deals:
+                if win_decision is None:
+                    win_decision = win_test.decision()
+                if score_decision is None:
+                    score_test.set_llr(self.score_llr(differences))
+                    score_decision = score_test.decision()
+                if win_decision is not None and score_decision is not None:
+                    break
+
+        return ComparisonResult(
+            deals,
+            win_decision,
+            score_decision,
+            baseline_wins / deals,
+            candidate_wins / deals,
+            sum(baseline_scores) / deals,
+            sum(candidate_scores) / deals,
+        )
+
+    def score_llr(self, differences: List[int]) -> float:
+        """Log-likelihood ratio of mean +score_margin against -score_margin.
+
+        Uses a normal approximation with the sample variance of the paired differences.
+        """
+        n = len(differences)
+        mean = sum(differences) / n
+        variance = sum((d - mean) ** 2 for d in differences) / (n - 1)
+        if variance == 0:
+            # Identical play on every deal carries no evidence either way
+            return 0.0
+        return 2 * self.score_margin * sum(differences) / variance
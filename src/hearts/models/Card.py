@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from components.CardProperties import CardProperties
+from hearts.components.CardProperties import CardProperties
 
 class Card:
     """Represents a standard playing card"""
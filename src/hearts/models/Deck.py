@@ -1,8 +1,8 @@
 import random
 from typing import List
 
-from components.CardProperties import CardProperties
-from models.Card import Card
+from hearts.components.CardProperties import CardProperties
+from hearts.models.Card import Card
 
 class Deck:
     """Represents a deck of 52 cards and its behaviors"""
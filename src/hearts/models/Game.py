@@ -1,10 +1,11 @@
 from copy import deepcopy
 from typing import List, Optional
-from components.CardProperties import CardProperties
-from models.Card import Card
-from models.Deck import Deck
-from models.Player import Player
-from models.RandomAgent import RandomPlayer
+from hearts.components.CardProperties import CardProperties
+from hearts.models.Agent import MCTSAgent
+from hearts.models.Card import Card
+from hearts.models.Deck import Deck
+from hearts.models.Player import Player
+from hearts.models.RandomAgent import RandomPlayer
 
 class HeartsGame:
     """Interpretation of the classic card game Hearts"""
@@ -15,7 +16,6 @@ class HeartsGame:
         num_players = 4
         num_players -= (num_mcts_agents + num_random_agents)  # Fill the rest with human players
 
-        from models.Agent import MCTSAgent
         # Initializes players, MCTS agent first
         self.players = [
             MCTSAgent(f"MCTS Player {i+1}", simulations) for i in range(num_mcts_agents)
@@ -101,7 +101,6 @@ class HeartsGame:
     
     def play_trick(self):
         """Facilitates playing 1 trick"""
-        from models.Agent import MCTSAgent
         self.current_trick = [] # Saves taken cards
         self.lead_suit = None
         print("\nStarting a new trick!")
@@ -247,6 +246,13 @@ class HeartsGame:
 
 
 
+    def get_played_cards(self) -> List[Card]:
+        """Return every card from the tricks completed so far this round."""
+        played_cards = []
+        for player in self.players:
+            played_cards.extend(player.takenCards)
+        return played_cards
+
     def evaluate_player_score(self, player_name: str) -> float:
         """Estimate a player's score for the current game state."""
         for player in self.players:
@@ -1,6 +1,6 @@
 from copy import deepcopy
-from components.CardProperties import CardProperties
-from models.Card import Card
+from hearts.components.CardProperties import CardProperties
+from hearts.models.Card import Card
 from typing import List, Optional
 
 class Player:
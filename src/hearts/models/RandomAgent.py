@@ -1,13 +1,14 @@
 import random
-from models.Player import Player
-from models.Card import Card
+from hearts.models.Player import Player
+from hearts.models.Card import Card
 from typing import List, Optional
-from components.CardProperties import CardProperties
+from hearts.components.CardProperties import CardProperties
 
 class RandomPlayer(Player):
     """Represents an agent that will play valid cards randomly"""
-    def __init__(self, name: str):
+    def __init__(self, name: str, rng: Optional[random.Random] = None):
         super().__init__(name)
+        self.rng = rng if rng is not None else random  # Defaults to the global random stream
 
     def play_card(self, lead_suit: Optional[int], heart_broken: Optional[bool]) -> Card:
         """Randomly select a card from the player's hand."""
@@ -28,7 +29,7 @@ class RandomPlayer(Player):
             valid_cards = self.hand[:]
 
         # Randomly select a valid card
-        selected_card = random.choice(valid_cards)
+        selected_card = self.rng.choice(valid_cards)
 
         return selected_card
     
@@ -0,0 +1,314 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from hearts.components.CardProperties import CardProperties
+from hearts.models.Deck import Deck
+
+NUM_SEATS = 4
+NUM_SUITS = len(CardProperties.SUITS)
+NUM_RANKS = len(CardProperties.RANKS)
+NUM_CARDS = NUM_SUITS * NUM_RANKS
+HEARTS = 2
+
+# Card ids follow the Deck ordering: id = suit * 13 + rank, so 0 is the 2 of Clubs
+_DECK = Deck().cards
+STARTING_CARD = next(i for i, card in enumerate(_DECK) if card.is_starting_card())
+QUEEN_OF_SPADES = next(i for i, card in enumerate(_DECK) if card.is_queen_of_spades())
+
+# Points per card id, same rules as Player.calculate_score
+CARD_POINTS = np.array(
+    [1 if card.is_heart() else 13 if card.is_queen_of_spades() else 0 for card in _DECK],
+    dtype=np.int16,
+)
+CARD_SUITS = np.array([card.suit for card in _DECK], dtype=np.int8)
+CARD_RANKS = np.array([card.rank for card in _DECK], dtype=np.int8)
+BREAKS_HEARTS = np.array([card.is_heart() or card.is_queen_of_spades() for card in _DECK], dtype=bool)
+NON_HEART_SUITS = [suit for suit in range(NUM_SUITS) if suit != HEARTS]
+SUIT_INDEX = np.arange(NUM_SUITS, dtype=np.int8)
+STARTING_CARD_MASK = np.arange(NUM_CARDS) == STARTING_CARD
+
+# Same rotation as HeartsGame.get_pass_direction: Left, Right, Across, No Passing
+PASS_DIRECTIONS = [1, -1, 2, 0]
+
+
+def _build_deal_owners() -> np.ndarray:
+    """Seat that ends up holding each dealt position, for every pass direction.
+
+    Mirrors HeartsGame.pass_cards: each player passes the first 3 cards of their hand
+    and player i receives the cards of player (i + direction).
+    """
+    cards_per_hand = NUM_CARDS // NUM_SEATS
+    owners = np.empty((len(PASS_DIRECTIONS), NUM_CARDS), dtype=np.int8)
+    for d, direction in enumerate(PASS_DIRECTIONS):
+        for position in range(NUM_CARDS):
+            seat = position // cards_per_hand
+            if direction != 0 and position % cards_per_hand < 3:
+                seat = (seat - direction) % NUM_SEATS
+            owners[d, position] = seat
+    return owners
+
+
+DEAL_OWNERS = _build_deal_owners()
+
+
+class VectorHeartsEnv:
+    """Steps N independent Hearts games in lockstep for batched training.
+
+    All state lives in preallocated NumPy arrays and every step is vectorized across
+    games, so no Card or Player objects are created and nothing is printed. Cards are
+    integer ids in Deck order (suit * 13 + rank).
+
+    The arrays returned by reset() and step() are reused between calls; copy them if
+    they need to outlive the next step. When dones[i] is set, game i has already been
+    reset and its final scores are in final_scores[i].
+
+    Playing a card and completing a trick write into preallocated buffers. Dealing
+    a new round still allocates, once per round.
+    """
+    def __init__(self, num_envs: int, target_score: int = 100, seed: Optional[int] = None):
+        if num_envs < 1:
+            raise ValueError("num_envs must be at least 1.")
+        self.num_envs = num_envs
+        self.target_score = target_score
+        self.rng = np.random.default_rng(seed)
+
+        n = num_envs
+        self._env_index = np.arange(n)
+
+        # Game state
+        self.hands = np.zeros((n, NUM_SEATS, NUM_CARDS), dtype=bool)
+        self.seen = np.zeros((n, NUM_CARDS), dtype=bool)
+        self.trick = np.full((n, NUM_SEATS), -1, dtype=np.int8)  # Card played by each seat, -1 if none
+        self.trick_size = np.zeros(n, dtype=np.int8)
+        self.lead_suit = np.full(n, -1, dtype=np.int8)
+        self.voids = np.zeros((n, NUM_SEATS, NUM_SUITS), dtype=bool)
+        self.hearts_broken = np.zeros(n, dtype=bool)
+        self.to_play = np.zeros(n, dtype=np.int8)
+        self.tricks_played = np.zeros(n, dtype=np.int8)
+        self.round_number = np.zeros(n, dtype=np.int16)
+        self.round_points = np.zeros((n, NUM_SEATS), dtype=np.int16)
+        self.scores = np.zeros((n, NUM_SEATS), dtype=np.int16)
+
+        # Outputs
+        self.hand_obs = np.zeros((n, NUM_CARDS), dtype=bool)
+        self.legal_actions = np.zeros((n, NUM_CARDS), dtype=bool)
+        self.rewards = np.zeros((n, NUM_SEATS), dtype=np.float32)
+        self.dones = np.zeros(n, dtype=bool)
+        self.final_scores = np.zeros((n, NUM_SEATS), dtype=np.int16)  # Valid where dones is set
+        self.observation: Dict[str, np.ndarray] = {
+            "hand": self.hand_obs,
+            "seen": self.seen,
+            "trick": self.trick,
+            "voids": self.voids,
+            "hearts_broken": self.hearts_broken,
+            "round_points": self.round_points,
+            "scores": self.scores,
+            "to_play": self.to_play,
+        }
+
+        # Scratch buffers, so stepping does not allocate
+        self._flat_index = np.zeros(n, dtype=np.intp)
+        self._action_legal = np.zeros(n, dtype=bool)
+        self._suits = np.zeros(n, dtype=np.int8)
+        self._lead_index = np.zeros(n, dtype=np.int8)
+        self._following = np.zeros(n, dtype=bool)
+        self._flags = np.zeros(n, dtype=bool)
+        self._hand_suits = np.zeros((n, NUM_SUITS), dtype=bool)
+        self._lead_suit_mask = np.zeros((n, NUM_SUITS), dtype=bool)
+        self._suit_allowed = np.zeros((n, NUM_SUITS), dtype=bool)
+        self._trick_done = np.zeros(n, dtype=bool)
+        self._trick_values = np.zeros((n, NUM_SEATS), dtype=np.int8)
+        self._trick_in_lead = np.zeros((n, NUM_SEATS), dtype=bool)
+        self._trick_points = np.zeros((n, NUM_SEATS), dtype=np.int16)
+        self._points = np.zeros(n, dtype=np.int16)
+        self._winner_points = np.zeros(n, dtype=np.int16)
+        self._winners = np.zeros(n, dtype=np.intp)
+        self._round_over = np.zeros(n, dtype=bool)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Start a fresh game in every environment and return (observation, legal_actions)."""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.scores[:] = 0
+        self.round_number[:] = 0
+        self.rewards[:] = 0
+        self.dones[:] = False
+        self._deal(self._env_index)
+        self._update_outputs()
+        return self.observation, self.legal_actions
+
+    def step(self, actions: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
+        """Play one card for the seat to move in every environment.
+
+        Returns (observation, legal_actions, rewards, dones). Rewards are per seat and
+        equal to minus the points taken this step. Finished games are reset
+        automatically, so the observation of a done environment is the new game's.
+        """
+        actions = np.asarray(actions)
+        env = self._env_index
+        index = self._flat_index
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"Expected {self.num_envs} actions, got shape {actions.shape}.")
+        if not np.issubdtype(actions.dtype, np.integer):
+            raise ValueError(f"Actions must be integer card ids, got dtype {actions.dtype}.")
+        if actions.min() < 0 or actions.max() >= NUM_CARDS:
+            raise ValueError(f"Card ids must be between 0 and {NUM_CARDS - 1}.")
+        # Index the flattened arrays directly so the lookups write into scratch buffers
+        np.multiply(env, NUM_CARDS, out=index)
+        index += actions
+        np.take(self.legal_actions.ravel(), index, out=self._action_legal, mode="clip")
+        if not self._action_legal.all():
+            bad = int(self._action_legal.argmin())
+            raise ValueError(f"Illegal card {int(actions[bad])} played in environment {bad}.")
+
+        self.rewards[:] = 0
+        self.dones[:] = False
+        seat = self.to_play
+        suits = self._suits
+        np.take(CARD_SUITS, actions, out=suits, mode="clip")
+        np.greater(self.trick_size, 0, out=self._following)
+
+        # Record a seat that fails to follow suit as void in the lead suit
+        off_suit = self._flags
+        np.not_equal(suits, self.lead_suit, out=off_suit)
+        off_suit &= self._following
+        np.multiply(env, NUM_SEATS, out=index)
+        index += seat
+        index *= NUM_SUITS
+        index += np.maximum(self.lead_suit, 0, out=self._lead_index)
+        voids = self.voids.reshape(-1)
+        np.logical_or(np.take(voids, index, out=self._action_legal, mode="clip"), off_suit, out=self._action_legal)
+        np.put(voids, index, self._action_legal)
+
+        # Play the card
+        np.multiply(env, NUM_SEATS, out=index)
+        index += seat
+        np.put(self.trick, index, actions)
+        index *= NUM_CARDS
+        index += actions
+        np.put(self.hands, index, False)
+        np.multiply(env, NUM_CARDS, out=index)
+        index += actions
+        np.put(self.seen, index, True)
+        np.logical_not(self._following, out=self._flags)
+        np.copyto(self.lead_suit, suits, where=self._flags)
+        self.trick_size += 1
+        np.take(BREAKS_HEARTS, actions, out=self._flags, mode="clip")
+        self.hearts_broken |= self._flags
+        seat += 1
+        seat %= NUM_SEATS
+
+        np.equal(self.trick_size, NUM_SEATS, out=self._trick_done)
+        if self._trick_done.any():
+            self._finish_tricks()
+
+        self._update_outputs()
+        return self.observation, self.legal_actions, self.rewards, self.dones
+
+    def _finish_tricks(self):
+        """Award completed tricks, then close out finished rounds and games."""
+        done = self._trick_done
+        trick = self.trick
+        # Highest card of the lead suit wins the trick. Unfinished tricks hold -1s, which
+        # clip to card 0; their results are masked out by done below.
+        in_lead = self._trick_in_lead
+        values = self._trick_values
+        np.take(CARD_SUITS, trick, out=values, mode="clip")
+        np.equal(values, self.lead_suit[:, None], out=in_lead)
+        np.take(CARD_RANKS, trick, out=values, mode="clip")
+        values += 1
+        values *= in_lead  # Cards off the lead suit rank below every lead-suit card
+        winners = self._winners
+        np.argmax(values, axis=1, out=winners)
+        points = self._points
+        np.take(CARD_POINTS, trick, out=self._trick_points, mode="clip")
+        np.sum(self._trick_points, axis=1, out=points)
+        points *= done
+
+        index = self._flat_index
+        np.multiply(self._env_index, NUM_SEATS, out=index)
+        index += winners
+        winner_points = self._winner_points
+        np.take(self.round_points.ravel(), index, out=winner_points, mode="clip")
+        winner_points += points
+        np.put(self.round_points, index, winner_points)
+        np.negative(points, out=winner_points)
+        np.put(self.rewards, index, winner_points)
+        np.copyto(self.to_play, winners, where=done)
+        np.copyto(trick, -1, where=done[:, None])
+        np.copyto(self.trick_size, 0, where=done)
+        np.copyto(self.lead_suit, -1, where=done)
+        self.tricks_played += done
+
+        np.equal(self.tricks_played, NUM_CARDS // NUM_SEATS, out=self._round_over)
+        if not self._round_over.any():
+            return
+        round_over = np.flatnonzero(self._round_over)
+        self.scores[round_over] += self.round_points[round_over]
+        self.round_number[round_over] += 1
+
+        game_over = round_over[(self.scores[round_over] >= self.target_score).any(axis=1)]
+        self.dones[game_over] = True
+        self.final_scores[game_over] = self.scores[game_over]
+        self.scores[game_over] = 0
+        self.round_number[game_over] = 0
+        self._deal(round_over)
+
+    def _deal(self, envs: np.ndarray):
+        """Shuffle, deal and pass cards for a new round in the given environments."""
+        positions = self.rng.random((envs.size, NUM_CARDS)).argsort(axis=1)
+        owners = DEAL_OWNERS[self.round_number[envs] % len(PASS_DIRECTIONS)]
+
+        self.hands[envs] = False
+        self.hands[envs[:, None], owners, positions] = True
+        self.seen[envs] = False
+        self.trick[envs] = -1
+        self.trick_size[envs] = 0
+        self.lead_suit[envs] = -1
+        self.voids[envs] = False
+        self.hearts_broken[envs] = False
+        self.tricks_played[envs] = 0
+        self.round_points[envs] = 0
+        # The holder of the 2 of Clubs leads the first trick
+        self.to_play[envs] = self.hands[envs, :, STARTING_CARD].argmax(axis=1)
+
+    def _update_outputs(self):
+        """Refresh the mover's hand and the legal-action mask."""
+        index = self._flat_index
+        np.multiply(self._env_index, NUM_SEATS, out=index)
+        index += self.to_play
+        np.take(self.hands.reshape(-1, NUM_CARDS), index, axis=0, out=self.hand_obs, mode="clip")
+        hand_by_suit = self.hand_obs.reshape(-1, NUM_SUITS, NUM_RANKS)
+        hand_suits = self._hand_suits
+        np.any(hand_by_suit, axis=2, out=hand_suits)
+        following = self._following
+        np.greater(self.trick_size, 0, out=following)
+
+        allowed = self._suit_allowed
+        allowed[:] = True
+        # Follow the lead suit if possible
+        lead_mask = self._lead_suit_mask
+        np.equal(SUIT_INDEX, self.lead_suit[:, None], out=lead_mask)
+        must_follow = self._flags
+        np.multiply(self._env_index, NUM_SUITS, out=index)
+        index += np.maximum(self.lead_suit, 0, out=self._lead_index)
+        np.take(hand_suits.ravel(), index, out=must_follow, mode="clip")
+        must_follow &= following
+        np.copyto(allowed, lead_mask, where=must_follow[:, None])
+        # Cannot lead with a heart until hearts are broken, unless only holding hearts
+        no_heart_lead = self._flags
+        no_heart_lead[:] = False
+        for suit in NON_HEART_SUITS:
+            no_heart_lead |= hand_suits[:, suit]
+        np.greater(no_heart_lead, following, out=no_heart_lead)
+        np.greater(no_heart_lead, self.hearts_broken, out=no_heart_lead)
+        np.greater(allowed[:, HEARTS], no_heart_lead, out=allowed[:, HEARTS])
+
+        np.logical_and(hand_by_suit, allowed[:, :, None], out=self.legal_actions.reshape(-1, NUM_SUITS, NUM_RANKS))
+
+        # The first trick of a round must be led with the 2 of Clubs
+        first_lead = self._flags
+        np.equal(self.tricks_played, 0, out=first_lead)
+        np.greater(first_lead, following, out=first_lead)
+        np.copyto(self.legal_actions, STARTING_CARD_MASK, where=first_lead[:, None])
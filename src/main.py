@@ -1,15 +1,5 @@
+from hearts.cli import main
 
-from models.Deck import Deck
-from models.Game import HeartsGame
-from models.Player import Player
-
-
-def main():
-    print("Welcome to the Hearts Card Game!")
-
-    # Start the game
-    game = HeartsGame(1, 2, 100)
-    game.start_game()
-
+# Kept so `python src/main.py` still works; installs use the `hearts` console script
 if __name__ == "__main__":
     main()